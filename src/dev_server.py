@@ -0,0 +1,165 @@
+import hashlib
+import logging
+import mimetypes
+import os
+import posixpath
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from markdown_processor import render_page
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    def __init__(self, body: bytes, content_type: str) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.etag = f"\"{hashlib.sha256(body).hexdigest()[:32]}\""
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if if_none_match is None:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/")
+            if tag == "*" or tag == self.etag:
+                return True
+        return False
+
+
+class PageCache:
+    def __init__(self, content_dir: str, static_dir: str, template_path: str, basepath: str = "/") -> None:
+        self.content_dir = content_dir
+        self.static_dir = static_dir
+        self.template_path = template_path
+        self.basepath = basepath
+        self._entries: dict[str, tuple[tuple, CachedResponse]] = {}
+        self._path_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, url_path: str) -> tuple[str, bool] | None:
+        raw_path = unquote(urlsplit(url_path).path)
+        path = posixpath.normpath(raw_path)
+        if raw_path.endswith("/") or path == ".":
+            path = posixpath.join(path, "index.html")
+        rel = path.lstrip("/")
+        if rel.startswith(".."):
+            return None
+        if rel.endswith(".html"):
+            md_path = os.path.join(self.content_dir, rel[:-len(".html")] + ".md")
+            if os.path.isfile(md_path):
+                return md_path, True
+        static_path = os.path.join(self.static_dir, rel)
+        if os.path.isfile(static_path):
+            return static_path, False
+        return None
+
+    def _stat_key(self, path: str) -> tuple:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, path: str, is_page: bool) -> CachedResponse:
+        if is_page:
+            logger.info(f"Rendering page {path}")
+            with open(path, "r", encoding="utf-8") as f:
+                md_string = f.read()
+            with open(self.template_path, "r", encoding="utf-8") as f:
+                template_string = f.read()
+            html = render_page(md_string, template_string, self.basepath)
+            return CachedResponse(html.encode("utf-8"), "text/html; charset=utf-8")
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return CachedResponse(body, content_type)
+
+    def get(self, url_path: str) -> CachedResponse | None:
+        resolved = self._resolve(url_path)
+        if resolved is None:
+            return None
+        path, is_page = resolved
+        key = self._stat_key(path)
+        if is_page:
+            key += self._stat_key(self.template_path)
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            with self._lock:
+                entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                return entry[1]
+            response = self._load(path, is_page)
+            with self._lock:
+                self._entries[path] = (key, response)
+            return response
+
+    def is_directory(self, url_path: str) -> bool:
+        rel = posixpath.normpath(unquote(urlsplit(url_path).path)).lstrip("/")
+        if rel.startswith(".."):
+            return False
+        return os.path.isdir(os.path.join(self.content_dir, rel)) or os.path.isdir(os.path.join(self.static_dir, rel))
+
+
+class DevServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], cache: PageCache) -> None:
+        super().__init__(address, DevRequestHandler)
+        self.cache = cache
+
+
+class DevRequestHandler(BaseHTTPRequestHandler):
+    server: DevServer
+
+    def do_GET(self) -> None:
+        self._respond(True)
+
+    def do_HEAD(self) -> None:
+        self._respond(False)
+
+    def _respond(self, send_body: bool) -> None:
+        cache = self.server.cache
+        try:
+            response = cache.get(self.path)
+        except Exception as e:
+            logger.exception(f"Failed to serve {self.path}")
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, explain=str(e))
+            return
+        if response is None:
+            if not urlsplit(self.path).path.endswith("/") and cache.is_directory(self.path):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", urlsplit(self.path).path + "/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        if response.matches(self.headers.get("If-None-Match")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", response.etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+def serve(content_dir: str, static_dir: str, template_path: str, port: int) -> None:
+    cache = PageCache(content_dir, static_dir, template_path)
+    with DevServer(("", port), cache) as server:
+        logger.info(f"Serving {content_dir} on http://localhost:{port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
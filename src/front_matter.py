@@ -0,0 +1,103 @@
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+_DELIMITERS = {"---": ":", "+++": "="}
+_TITLE_PATTERN = re.compile(r"^#[^#\n]+$", re.MULTILINE)
+_READ_BUFFER_SIZE = 4096
+
+_cache: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _parse_value(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _parse_line(line: str, separator: str) -> tuple[str, str] | None:
+    stripped = line.strip()
+    if len(stripped) == 0 or stripped.startswith("#") or separator not in stripped:
+        return None
+    key, value = stripped.split(separator, 1)
+    return key.strip(), _parse_value(value)
+
+
+def split_front_matter(markdown: str) -> tuple[dict[str, str], str]:
+    first_line, _, rest = markdown.partition("\n")
+    separator = _DELIMITERS.get(first_line.strip())
+    if separator is None:
+        return {}, markdown
+    metadata = {}
+    offset = 0
+    for line in rest.splitlines(keepends=True):
+        offset += len(line)
+        if line.strip() == first_line.strip():
+            return metadata, rest[offset:]
+        parsed = _parse_line(line, separator)
+        if parsed is not None:
+            metadata[parsed[0]] = parsed[1]
+    return {}, markdown
+
+
+def find_title(markdown: str) -> str | None:
+    match = _TITLE_PATTERN.search(markdown)
+    if match is None:
+        return None
+    return match.group(0).lstrip("#").strip()
+
+
+def _read_metadata(path: str) -> dict[str, str]:
+    metadata = {}
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        first_line = f.readline().decode("utf-8")
+        separator = _DELIMITERS.get(first_line.strip())
+        if separator is not None:
+            for raw_line in f:
+                line = raw_line.decode("utf-8")
+                if line.strip() == first_line.strip():
+                    break
+                parsed = _parse_line(line, separator)
+                if parsed is not None:
+                    metadata[parsed[0]] = parsed[1]
+            else:
+                metadata = {}
+                f.seek(0)
+        else:
+            f.seek(0)
+        if not metadata.get("title"):
+            for raw_line in f:
+                title = find_title(raw_line.decode("utf-8"))
+                if title is not None:
+                    metadata["title"] = title
+                    break
+    return metadata
+
+
+def read_metadata(path: str) -> dict[str, str]:
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        entry = _cache.get(path)
+    if entry is not None and entry[0] == key:
+        return dict(entry[1])
+    logger.debug(f"Reading metadata from file {path}")
+    metadata = _read_metadata(path)
+    with _cache_lock:
+        _cache[path] = (key, metadata)
+    return dict(metadata)
+
+
+def collect_metadata(dir_path_content: str) -> dict[str, dict[str, str]]:
+    result = {}
+    for root, _, files in os.walk(dir_path_content):
+        for file in files:
+            if file.endswith(".md"):
+                path = os.path.join(root, file)
+                result[os.path.relpath(path, dir_path_content)] = read_metadata(path)
+    return result
@@ -1,12 +1,53 @@
 import logging
+import os
 import sys
 
+from dev_server import serve
 from file_copier import copy_directory
-from markdown_processor import generate_pages_recursive
+from markdown_processor import BuildTarget, generate_pages_multi, generate_pages_recursive
 
 logging.basicConfig(level=logging.INFO)
 
+def parse_target(spec: str) -> BuildTarget:
+    parts = spec.split(":", 2)
+    dest = parts[0]
+    basepath = parts[1] if len(parts) > 1 and parts[1] else "/"
+    template_path = parts[2] if len(parts) > 2 and parts[2] else None
+    return BuildTarget(dest, basepath, template_path)
+
+def is_protected_dest(dest: str, protected: list[str]) -> bool:
+    dest = os.path.realpath(dest)
+    if dest == os.path.realpath("."):
+        return True
+    for path in protected:
+        path = os.path.realpath(path)
+        if os.path.commonpath([dest, path]) in (dest, path):
+            return True
+    return False
+
 def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        try:
+            port = int(sys.argv[2]) if len(sys.argv) > 2 else 8888
+        except ValueError:
+            print("usage: main.py serve [PORT]", file=sys.stderr)
+            sys.exit(2)
+        serve("./content/", "./static", "./template.html", port)
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        targets = [parse_target(spec) for spec in sys.argv[2:]]
+        if len(targets) == 0:
+            print("usage: main.py build DEST[:BASEPATH[:TEMPLATE]]...", file=sys.stderr)
+            sys.exit(2)
+        for target in targets:
+            if is_protected_dest(target.dest_dir, ["./content", "./static"]):
+                print(f"refusing to build into {target.dest_dir}: it would overwrite the sources", file=sys.stderr)
+                print("usage: main.py build DEST[:BASEPATH[:TEMPLATE]]...", file=sys.stderr)
+                sys.exit(2)
+        for target in targets:
+            copy_directory("./static", target.dest_dir)
+        generate_pages_multi("./content/", "./template.html", targets)
+        return
     if len(sys.argv) > 1:
         basepath = sys.argv[1]
     else:
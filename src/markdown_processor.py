@@ -2,6 +2,7 @@ import logging
 import os
 from enum import Enum
 
+from front_matter import find_title, split_front_matter
 from HTMLNode import ParentNode, LeafNode, HTMLNode
 from textnode import text_to_textnodes
 import re
@@ -106,11 +107,36 @@ def block_to_heading(markdown: str) -> HTMLNode:
     return ParentNode("h" + str(level), children)
 
 def extract_title(markdown: str) -> str:
-    lines = markdown.split("\n")
-    for line in lines:
-        if re.match(r"^#[^#]+$", line) is not None:
-            return line.lstrip("#").strip()
-    raise ValueError("no title found")
+    title = find_title(markdown)
+    if title is None:
+        raise ValueError("no title found")
+    return title
+
+def split_url_slots(html: str) -> list[str]:
+    return re.split(r"(?<=href=\")/|(?<=src=\")/", html)
+
+def fill_url_slots(fragments: list[str], basepath: str) -> str:
+    return basepath.join(fragments)
+
+def apply_template(template_string: str, title: str, html: str) -> str:
+    return template_string.replace("{{ Title }}", title).replace("{{ Content }}", html)
+
+def _parse_page(md_string: str) -> tuple[str, str]:
+    metadata, body = split_front_matter(md_string)
+    html = markdown_to_html_node(body).to_html()
+    title = metadata.get("title") or extract_title(body)
+    return title, html
+
+def render_page(md_string: str, template_string: str, basepath: str) -> str:
+    title, html = _parse_page(md_string)
+    return fill_url_slots(split_url_slots(apply_template(template_string, title, html)), basepath)
+
+def _write_file(dest_path: str, content: str) -> None:
+    if not os.path.exists(os.path.dirname(dest_path)):
+        os.makedirs(os.path.dirname(dest_path))
+    with open(dest_path, "w", encoding="utf-8") as f:
+        logger.debug(f"Writing to file {dest_path}")
+        f.write(content)
 
 def generate_page(from_path: str, template_path: str, dest_path: str, basepath: str) -> None:
     logger.info(f"Generating page from {from_path} to {dest_path} using {template_path}")
@@ -123,17 +149,8 @@ def generate_page(from_path: str, template_path: str, dest_path: str, basepath:
         logger.debug(f"Reading from file {template_path}")
         template_string = f.read()
 
-    html = markdown_to_html_node(md_string).to_html()
-    title = extract_title(md_string)
-    result = template_string.replace("{{ Title }}", title).replace("{{ Content }}", html)
-    result = result.replace("href=\"/", f"href=\"{basepath}")
-    result = result.replace("src=\"/", f"src=\"{basepath}")
-
-    if not os.path.exists(os.path.dirname(dest_path)):
-        os.makedirs(os.path.dirname(dest_path))
-    with open(dest_path, "w", encoding="utf-8") as f:
-        logger.debug(f"Writing to file {dest_path}")
-        f.write(result)
+    result = render_page(md_string, template_string, basepath)
+    _write_file(dest_path, result)
 
 def generate_pages_recursive(dir_path_content: str, template_path: str, dest_dir_path: str, basepath: str) -> None:
     for file in os.listdir(dir_path_content):
@@ -141,4 +158,44 @@ def generate_pages_recursive(dir_path_content: str, template_path: str, dest_dir
             if file.endswith(".md"):
                 generate_page(os.path.join(dir_path_content, file), template_path, os.path.join(dest_dir_path, re.sub(r".md$", ".html", file)), basepath)
         else:
-            generate_pages_recursive(os.path.join(dir_path_content, file), template_path, os.path.join(dest_dir_path, file), basepath)
\ No newline at end of file
+            generate_pages_recursive(os.path.join(dir_path_content, file), template_path, os.path.join(dest_dir_path, file), basepath)
+
+class BuildTarget:
+    def __init__(self, dest_dir: str, basepath: str = "/", template_path: str | None = None) -> None:
+        self.dest_dir = dest_dir
+        self.basepath = basepath
+        self.template_path = template_path
+
+    def __repr__(self) -> str:
+        return f"BuildTarget({self.dest_dir}, {self.basepath}, {self.template_path})"
+
+def generate_pages_multi(dir_path_content: str, template_path: str, targets: list[BuildTarget]) -> None:
+    templates: dict[str, str] = {}
+    for target in targets:
+        path = target.template_path or template_path
+        if path not in templates:
+            with open(path, "r", encoding="utf-8") as f:
+                logger.debug(f"Reading from file {path}")
+                templates[path] = f.read()
+    _generate_pages_multi(dir_path_content, "", templates, template_path, targets)
+
+def _generate_pages_multi(dir_path_content: str, rel_dir: str, templates: dict[str, str], template_path: str, targets: list[BuildTarget]) -> None:
+    for file in os.listdir(dir_path_content):
+        from_path = os.path.join(dir_path_content, file)
+        if not os.path.isfile(from_path):
+            _generate_pages_multi(from_path, os.path.join(rel_dir, file), templates, template_path, targets)
+            continue
+        if not file.endswith(".md"):
+            continue
+        logger.info(f"Generating page from {from_path} for {len(targets)} targets")
+        with open(from_path, "r", encoding="utf-8") as f:
+            logger.debug(f"Reading from file {from_path}")
+            md_string = f.read()
+        title, html = _parse_page(md_string)
+        rel_path = os.path.join(rel_dir, re.sub(r".md$", ".html", file))
+        slots: dict[str, list[str]] = {}
+        for target in targets:
+            path = target.template_path or template_path
+            if path not in slots:
+                slots[path] = split_url_slots(apply_template(templates[path], title, html))
+            _write_file(os.path.join(target.dest_dir, rel_path), fill_url_slots(slots[path], target.basepath))
@@ -0,0 +1,151 @@
+import http.client
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from dev_server import DevServer, PageCache
+from markdown_processor import render_page
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _make_site(root):
+    content = os.path.join(root, "content")
+    static = os.path.join(root, "static")
+    os.makedirs(os.path.join(content, "blog"))
+    os.makedirs(static)
+    template = os.path.join(root, "template.html")
+    _write(template, "<title>{{ Title }}</title>{{ Content }}")
+    _write(os.path.join(content, "index.md"), "# home\n\nhello")
+    _write(os.path.join(content, "blog", "index.md"), "# blog")
+    _write(os.path.join(content, "broken.md"), "no title")
+    _write(os.path.join(static, "index.css"), "body {}")
+    return PageCache(content, static, template)
+
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = _make_site(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_render_page(self):
+        response = self.cache.get("/")
+        self.assertEqual(b"<title>home</title><div><h1>home</h1><p>hello</p></div>", response.body)
+        self.assertEqual("text/html; charset=utf-8", response.content_type)
+
+    def test_nested_page(self):
+        self.assertEqual(self.cache.get("/blog/").body, self.cache.get("/blog/index.html").body)
+
+    def test_static_file(self):
+        response = self.cache.get("/index.css")
+        self.assertEqual(b"body {}", response.body)
+        self.assertEqual("text/css", response.content_type)
+
+    def test_cached(self):
+        self.assertIs(self.cache.get("/"), self.cache.get("/?q=1"))
+
+    def test_concurrent_render_once(self):
+        calls = []
+
+        def slow_render(*args):
+            calls.append(args)
+            time.sleep(0.05)
+            return render_page(*args)
+
+        with mock.patch("dev_server.render_page", side_effect=slow_render):
+            threads = [threading.Thread(target=self.cache.get, args=("/",)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(1, len(calls))
+
+    def test_etag(self):
+        response = self.cache.get("/")
+        self.assertTrue(response.matches(response.etag))
+        self.assertTrue(response.matches(f"\"other\", {response.etag}"))
+        self.assertTrue(response.matches(f"W/{response.etag}"))
+        self.assertTrue(response.matches("*"))
+        self.assertFalse(response.matches("\"other\""))
+        self.assertFalse(response.matches(None))
+
+    def test_missing(self):
+        self.assertIsNone(self.cache.get("/nope.html"))
+        self.assertTrue(self.cache.is_directory("/blog"))
+
+    def test_path_traversal(self):
+        secret = os.path.join(self.tmp.name, "secret.txt")
+        with open(secret, "w", encoding="utf-8") as f:
+            f.write("secret")
+        self.assertIsNone(self.cache.get("/../secret.txt"))
+        self.assertIsNone(self.cache.get("/%2e%2e/secret.txt"))
+        self.assertIsNone(self.cache.get("/blog/../../secret.txt"))
+
+
+class TestDevServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = DevServer(("127.0.0.1", 0), _make_site(self.tmp.name))
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05})
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp.cleanup()
+
+    def _request(self, method, path, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1])
+        try:
+            conn.request(method, path, headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def test_get_etag(self):
+        response, body = self._request("GET", "/")
+        self.assertEqual(200, response.status)
+        self.assertEqual(b"<title>home</title><div><h1>home</h1><p>hello</p></div>", body)
+        self.assertIsNotNone(response.getheader("ETag"))
+
+    def test_not_modified(self):
+        response, _ = self._request("GET", "/")
+        etag = response.getheader("ETag")
+        response, body = self._request("GET", "/", {"If-None-Match": etag})
+        self.assertEqual(304, response.status)
+        self.assertEqual(etag, response.getheader("ETag"))
+        self.assertEqual(b"", body)
+        response, _ = self._request("GET", "/", {"If-None-Match": f"W/{etag}"})
+        self.assertEqual(304, response.status)
+
+    def test_head(self):
+        response, body = self._request("HEAD", "/")
+        self.assertEqual(200, response.status)
+        self.assertEqual(b"", body)
+        self.assertNotEqual("0", response.getheader("Content-Length"))
+
+    def test_redirect_directory(self):
+        response, _ = self._request("GET", "/blog")
+        self.assertEqual(301, response.status)
+        self.assertEqual("/blog/", response.getheader("Location"))
+
+    def test_not_found(self):
+        response, _ = self._request("GET", "/nope.html")
+        self.assertEqual(404, response.status)
+
+    def test_render_error(self):
+        with self.assertLogs("dev_server", level="ERROR"):
+            response, body = self._request("GET", "/broken.html")
+        self.assertEqual(500, response.status)
+        self.assertIn(b"no title found", body)
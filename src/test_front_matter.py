@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+from front_matter import split_front_matter, find_title, read_metadata, collect_metadata
+from markdown_processor import render_page
+
+
+class TestFrontMatter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_split_yaml(self):
+        metadata, body = split_front_matter("---\ntitle: \"Hello\"\ndate: 2024-01-01\n---\n# heading\n")
+        self.assertEqual({"title": "Hello", "date": "2024-01-01"}, metadata)
+        self.assertEqual("# heading\n", body)
+
+    def test_split_toml(self):
+        metadata, body = split_front_matter("+++\ntitle = 'Hello'\n+++\nbody")
+        self.assertEqual({"title": "Hello"}, metadata)
+        self.assertEqual("body", body)
+
+    def test_split_unterminated(self):
+        md = "---\ntitle: Hello\n# heading"
+        self.assertEqual(({}, md), split_front_matter(md))
+
+    def test_find_title(self):
+        self.assertEqual("title", find_title("## test\n# title\n### test2"))
+        self.assertIsNone(find_title("## test\n"))
+
+    def test_render_page_strips_front_matter(self):
+        md = "---\ntitle: Front\n---\n# heading"
+        self.assertEqual("Front|<div><h1>heading</h1></div>", render_page(md, "{{ Title }}|{{ Content }}", "/"))
+
+    def test_read_metadata(self):
+        path = self._write("page.md", "---\ndate: 2024-01-01\n---\n\n## sub\n# title\n")
+        self.assertEqual({"date": "2024-01-01", "title": "title"}, read_metadata(path))
+
+    def test_read_metadata_empty_title(self):
+        md = "---\ntitle:\n---\n# Real"
+        path = self._write("page.md", md)
+        self.assertEqual("Real", read_metadata(path)["title"])
+        self.assertEqual("<title>Real</title>", render_page(md, "<title>{{ Title }}</title>", "/"))
+
+    def test_read_metadata_without_front_matter(self):
+        path = self._write("page.md", "# title\n\nbody")
+        self.assertEqual({"title": "title"}, read_metadata(path))
+
+    def test_read_metadata_cached(self):
+        path = self._write("page.md", "---\ntitle: one\n---\n")
+        read_metadata(path)["url"] = "/page.html"
+        self.assertEqual({"title": "one"}, read_metadata(path))
+        self._write("page.md", "---\ntitle: second\n---\n")
+        self.assertEqual("second", read_metadata(path)["title"])
+
+    def test_collect_metadata(self):
+        os.makedirs(os.path.join(self.tmp.name, "blog"))
+        self._write("index.md", "# home")
+        self._write(os.path.join("blog", "index.md"), "---\ntitle: blog\n---\n")
+        self.assertEqual(
+            {"index.md": {"title": "home"}, os.path.join("blog", "index.md"): {"title": "blog"}},
+            collect_metadata(self.tmp.name),
+        )
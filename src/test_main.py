@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from main import is_protected_dest, main
+
+
+class TestBuildTargets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        os.makedirs(os.path.join("content", "blog"))
+        os.makedirs("static")
+        with open(os.path.join("static", "index.css"), "w", encoding="utf-8") as f:
+            f.write("body {}")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_is_protected_dest(self):
+        protected = ["./content", "./static"]
+        for dest in [".", "./", "..", "static", "./static/", "content", "content/blog", "static/out"]:
+            self.assertTrue(is_protected_dest(dest, protected), dest)
+        for dest in ["docs", "./public", "out/site", "static_out"]:
+            self.assertFalse(is_protected_dest(dest, protected), dest)
+
+    def test_build_refuses_sources(self):
+        with mock.patch("sys.argv", ["main.py", "build", "docs", "static:/"]), \
+                mock.patch("sys.stderr"):
+            with self.assertRaises(SystemExit) as cm:
+                main()
+        self.assertEqual(2, cm.exception.code)
+        self.assertTrue(os.path.isfile(os.path.join("static", "index.css")))
+        self.assertFalse(os.path.exists("docs"))
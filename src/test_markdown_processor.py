@@ -1,7 +1,9 @@
+import os
+import tempfile
 import unittest
 
 from markdown_processor import _markdown_to_blocks, BlockType, block_to_blocktype, markdown_to_html_node, \
-    extract_title
+    extract_title, split_url_slots, fill_url_slots, BuildTarget, generate_pages_multi
 from textnode import TextNode, TextType, _split_nodes_delimiter, _split_nodes_image, _split_nodes_link, \
     _extract_markdown_images, _extract_markdown_links, text_to_textnodes
 
@@ -260,3 +262,41 @@ the **same** even with inline stuff
 """
         title = extract_title(md)
         self.assertEqual(title, "title")
+
+    def test_url_slots(self):
+        html = '<a href="/blog">x</a><img src="/a.png" alt="y"></img><a href="https://x.com">z</a>'
+        fragments = split_url_slots(html)
+        self.assertEqual(3, len(fragments))
+        self.assertEqual(html, fill_url_slots(fragments, "/"))
+        self.assertEqual(
+            '<a href="/base/blog">x</a><img src="/base/a.png" alt="y"></img><a href="https://x.com">z</a>',
+            fill_url_slots(fragments, "/base/"),
+        )
+
+    def test_generate_pages_multi(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            content = os.path.join(tmp, "content")
+            os.makedirs(os.path.join(content, "blog"))
+            md = "# title\n\n[home](/index.html)"
+            with open(os.path.join(content, "blog", "index.md"), "w", encoding="utf-8") as f:
+                f.write(md)
+            template = os.path.join(tmp, "template.html")
+            with open(template, "w", encoding="utf-8") as f:
+                f.write('<link href="/index.css" />{{ Title }}{{ Content }}')
+            other_template = os.path.join(tmp, "other.html")
+            with open(other_template, "w", encoding="utf-8") as f:
+                f.write("<p>{{ Title }}</p>{{ Content }}")
+            targets = [
+                BuildTarget(os.path.join(tmp, "a"), "/"),
+                BuildTarget(os.path.join(tmp, "b"), "/base/"),
+                BuildTarget(os.path.join(tmp, "c"), "/base/", other_template),
+            ]
+            generate_pages_multi(content, template, targets)
+            expected = {
+                "a": '<link href="/index.css" />title<div><h1>title</h1><p><a href="/index.html">home</a></p></div>',
+                "b": '<link href="/base/index.css" />title<div><h1>title</h1><p><a href="/base/index.html">home</a></p></div>',
+                "c": '<p>title</p><div><h1>title</h1><p><a href="/base/index.html">home</a></p></div>',
+            }
+            for name, html in expected.items():
+                with open(os.path.join(tmp, name, "blog", "index.html"), "r", encoding="utf-8") as f:
+                    self.assertEqual(html, f.read())